@@ -38,6 +38,8 @@ from petstore_api.model_utils import (
     validate_and_convert_types
 )
 
+_CHARSET_RE = re.compile(r"charset=([a-zA-Z\-\d]+)[\s\;]?")
+
 
 class ApiClient(object):
     """Generic API client for OpenAPI client library builds.
@@ -62,6 +64,7 @@ class ApiClient(object):
     """
 
     _pool = None
+    _default = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None, pool_threads=1):
@@ -78,6 +81,31 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
 
+    @classmethod
+    def get_default(cls):
+        """Return default instance of ApiClient.
+
+        This method returns the ApiClient passed by the set_default method,
+        or a newly created ApiClient when no default has been set, so
+        sharing one client between API objects is opt-in.
+
+        :return: The ApiClient object.
+        """
+        if cls._default is None:
+            return cls()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Set default instance of ApiClient.
+
+        It stores default ApiClient, which is returned by get_default.
+        Pass None to go back to a fresh ApiClient per API object.
+
+        :param default: object of ApiClient
+        """
+        cls._default = default
+
     def __enter__(self):
         return self
 
@@ -215,7 +243,7 @@ class ApiClient(object):
                 encoding = "utf-8"
                 content_type = response_data.getheader('content-type')
                 if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s\;]?", content_type)
+                    match = _CHARSET_RE.search(content_type)
                     if match:
                         encoding = match.group(1)
                 response_data.data = response_data.data.decode(encoding)
@@ -686,6 +714,10 @@ class Endpoint(object):
         self.headers_map = headers_map
         self.api_client = api_client
         self.callable = callable
+        # the header lists are fixed per endpoint, so the selected Accept and
+        # Content-Type values are computed once on first call
+        self._accept_header = None
+        self._content_type_header = None
 
     def __validate_inputs(self, kwargs):
         for param in self.params_map['enum']:
@@ -821,14 +853,18 @@ class Endpoint(object):
 
         accept_headers_list = self.headers_map['accept']
         if accept_headers_list:
-            params['header']['Accept'] = self.api_client.select_header_accept(
-                accept_headers_list)
+            if self._accept_header is None:
+                self._accept_header = self.api_client.select_header_accept(
+                    accept_headers_list)
+            params['header']['Accept'] = self._accept_header
 
         content_type_headers_list = self.headers_map['content_type']
         if content_type_headers_list:
-            header_list = self.api_client.select_header_content_type(
-                content_type_headers_list)
-            params['header']['Content-Type'] = header_list
+            if self._content_type_header is None:
+                self._content_type_header = \
+                    self.api_client.select_header_content_type(
+                        content_type_headers_list)
+            params['header']['Content-Type'] = self._content_type_header
 
         return self.api_client.call_api(
             self.settings['endpoint_path'], self.settings['http_method'],
@@ -9,6 +9,7 @@
 
 
 from datetime import date, datetime  # noqa: F401
+from functools import lru_cache
 import inspect
 import io
 import os
@@ -28,6 +29,8 @@ from petstore_api.exceptions import (
 none_type = type(None)
 file_type = io.IOBase
 
+_FILENAME_RE = re.compile(r'filename=[\'"]?([^\'"\s]+)[\'"]?')
+
 
 class cached_property(object):
     # this caches the result of the function call for fn with no inputs
@@ -49,6 +52,7 @@ class cached_property(object):
 
 PRIMITIVE_TYPES = (list, float, int, bool, datetime, date, str, file_type)
 
+@lru_cache(maxsize=None)
 def allows_single_value_input(cls):
     """
     This function returns True if the input composed schema model or any
@@ -60,7 +64,6 @@ def allows_single_value_input(cls):
       - StringEnum
       - ArrayModel
       - null
-    TODO: lru_cache this
     """
     if (
         issubclass(cls, ModelSimple) or
@@ -968,16 +971,22 @@ def get_discriminated_classes(cls):
 
 
 def get_possible_classes(cls, from_server_context):
-    # TODO: lru_cache this
+    # the result only depends on the class definition, so it is cached as a
+    # tuple and a fresh list is handed to each caller
+    return list(_get_possible_classes(cls, from_server_context))
+
+
+@lru_cache(maxsize=None)
+def _get_possible_classes(cls, from_server_context):
     possible_classes = [cls]
     if from_server_context:
-        return possible_classes
+        return tuple(possible_classes)
     if hasattr(cls, 'discriminator') and cls.discriminator is not None:
         possible_classes = []
         possible_classes.extend(get_discriminated_classes(cls))
     elif issubclass(cls, ModelComposed):
         possible_classes.extend(composed_model_input_classes(cls))
-    return possible_classes
+    return tuple(possible_classes)
 
 
 def get_required_type_classes(required_types_mixed, spec_property_naming):
@@ -1226,8 +1235,7 @@ def deserialize_file(response_data, configuration, content_disposition=None):
     os.remove(path)
 
     if content_disposition:
-        filename = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
-                             content_disposition).group(1)
+        filename = _FILENAME_RE.search(content_disposition).group(1)
         path = os.path.join(os.path.dirname(path), filename)
 
     with open(path, "wb") as f:
@@ -22,6 +22,12 @@ from petstore_api.exceptions import ApiException, UnauthorizedException, Forbidd
 
 logger = logging.getLogger(__name__)
 
+_JSON_MIME_RE = re.compile('json', re.IGNORECASE)
+
+_HTTP_METHODS = frozenset(['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                           'PATCH', 'OPTIONS'])
+_BODY_METHODS = frozenset(['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE'])
+
 
 class RESTResponse(io.IOBase):
 
@@ -117,8 +123,7 @@ class RESTClientObject(object):
                                  (connection, read) timeouts.
         """
         method = method.upper()
-        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
-                          'PATCH', 'OPTIONS']
+        assert method in _HTTP_METHODS
 
         if post_params and body:
             raise ApiValueError(
@@ -142,10 +147,10 @@ class RESTClientObject(object):
 
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
-            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if method in _BODY_METHODS:
                 if query_params:
                     url += '?' + urlencode(query_params)
-                if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if _JSON_MIME_RE.search(headers['Content-Type']):
                     request_body = None
                     if body is not None:
                         request_body = json.dumps(body)
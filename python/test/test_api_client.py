@@ -0,0 +1,49 @@
+# coding: utf-8
+
+"""
+    OpenAPI Petstore
+
+    This spec is mainly for testing Petstore server and contains fake endpoints, models. Please do not use this for any other purpose. Special characters: \" \\  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+import unittest
+
+import petstore_api
+from petstore_api.api.pet_api import PetApi  # noqa: E501
+
+
+class TestApiClientDefault(unittest.TestCase):
+    """ApiClient default instance unit tests"""
+
+    def tearDown(self):
+        petstore_api.ApiClient.set_default(None)
+        petstore_api.Configuration.set_default(None)
+
+    def test_no_default_builds_fresh_client(self):
+        self.assertIsNot(PetApi().api_client, PetApi().api_client)
+
+    def test_configuration_default_is_honored(self):
+        PetApi()
+        petstore_api.Configuration.set_default(
+            petstore_api.Configuration(host="http://other"))
+        self.assertEqual(PetApi().api_client.configuration.host,
+                         "http://other")
+
+    def test_headers_do_not_leak_between_apis(self):
+        PetApi().api_client.set_default_header("X-Tenant", "A")
+        self.assertNotIn("X-Tenant", PetApi().api_client.default_headers)
+
+    def test_set_default_is_honored(self):
+        api_client = petstore_api.ApiClient()
+        petstore_api.ApiClient.set_default(api_client)
+        self.assertIs(petstore_api.ApiClient.get_default(), api_client)
+        self.assertIs(PetApi().api_client, api_client)
+
+
+if __name__ == '__main__':
+    unittest.main()